@@ -10,6 +10,8 @@ from .synapse.const import DOMAIN, SynapseBinarySensorDefinition
 from .synapse.base_entity import SynapseBaseEntity
 from .health import SynapseHealthSensor
 
+_LOGGER = logging.getLogger(__name__)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -17,16 +19,15 @@ async def async_setup_entry(
 ) -> None:
     """Setup the router platform."""
     bridge: SynapseBridge = hass.data[DOMAIN][config_entry.entry_id]
-    entities = bridge.app_data.get("binary_sensor")
-
-    if entities is not None:
-      async_add_entities(SynapseBinarySensor(hass, bridge, entity) for entity in entities)
+    entities = [SynapseBinarySensor(hass, bridge, entity) for entity in bridge.entities_for("binary_sensor")]
 
-    # add health check sensor
-    health = SynapseHealthSensor(bridge, hass)
-    async_add_entities([health])
+    # add health check sensor, in the same batch as the app's sensors
+    entities.append(SynapseHealthSensor(bridge, hass))
+    async_add_entities(entities)
 
 class SynapseBinarySensor(SynapseBaseEntity, BinarySensorEntity):
+    logger = _LOGGER
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -34,12 +35,9 @@ class SynapseBinarySensor(SynapseBaseEntity, BinarySensorEntity):
         entity: SynapseBinarySensorDefinition,
     ):
         super().__init__(hass, bridge, entity)
-        self.logger = logging.getLogger(__name__)
-
-    @property
-    def device_class(self):
-        return self.entity.get("device_class")
 
-    @property
-    def is_on(self):
-        return self.entity.get("is_on")
+    def _apply_attributes(self) -> None:
+        super()._apply_attributes()
+        get = self.entity.get
+        self._attr_device_class = get("device_class")
+        self._attr_is_on = get("is_on")
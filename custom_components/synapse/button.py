@@ -2,13 +2,15 @@ import logging
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .synapse.base_entity import SynapseBaseEntity
 from .synapse.bridge import SynapseBridge
 from .synapse.const import DOMAIN, SynapseButtonDefinition
 
+_LOGGER = logging.getLogger(__name__)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -16,11 +18,11 @@ async def async_setup_entry(
 ) -> None:
     """Setup the router platform."""
     bridge: SynapseBridge = hass.data[DOMAIN][config_entry.entry_id]
-    entities = bridge.app_data.get("button")
-    if entities is not None:
-      async_add_entities(SynapseButton(hass, bridge, entity) for entity in entities)
+    async_add_entities([SynapseButton(hass, bridge, entity) for entity in bridge.entities_for("button")])
 
 class SynapseButton(SynapseBaseEntity, ButtonEntity):
+    logger = _LOGGER
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -28,16 +30,11 @@ class SynapseButton(SynapseBaseEntity, ButtonEntity):
         entity: SynapseButtonDefinition,
     ):
         super().__init__(hass, bridge, entity)
-        self.logger = logging.getLogger(__name__)
 
-    @property
-    def device_class(self):
-        return self.entity.get("device_class")
+    def _apply_attributes(self) -> None:
+        super()._apply_attributes()
+        self._attr_device_class = self.entity.get("device_class")
 
-    @callback
     async def async_press(self, **kwargs) -> None:
         """Handle the button press."""
-        self.hass.bus.async_fire(
-            self.bridge.event_name("press"),
-            {"unique_id": self.entity.get("unique_id"), **kwargs},
-        )
+        self._fire("press", **kwargs)
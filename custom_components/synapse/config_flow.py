@@ -28,14 +28,29 @@ from typing import Any
 
 import asyncio
 import logging
+from functools import partial
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 
 from .synapse.helpers import hex_to_object
 from .synapse.const import DOMAIN, EVENT_NAMESPACE, SynapseApplication, QUERY_TIMEOUT
 
+# confirm step takes no input
+_EMPTY_SCHEMA = vol.Schema({})
+
+@callback
+def _identify_filter(event_data) -> bool:
+    """Only replies carrying a payload are worth collecting, rejected events never get scheduled"""
+    return bool(event_data.get("compressed"))
+
+@callback
+def _collect_identify(replies: set[str], event) -> None:
+    """Gather identify payloads, identical re-announcements collapse here before decoding"""
+    replies.add(event.data["compressed"])
+
 
 class SynapseConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for synapse"""
@@ -47,7 +62,7 @@ class SynapseConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the Synapse flow."""
         self.application: SynapseApplication | None = None
         self.discovery_info: dict | None = None
-        self.known_apps = []
+        self.known_apps: dict[str, SynapseApplication] = {}
         self.logger = logging.getLogger(__name__)
 
     async def async_step_user(self, user_input=None):
@@ -56,20 +71,15 @@ class SynapseConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                selected_app_name = user_input[CONF_NAME]
-                selected_app_info = next(app for app in self.known_apps if app["app"] == selected_app_name)
-
-                await self.async_set_unique_id(selected_app_info.get("unique_id"))
-                self._abort_if_unique_id_configured()
-                return self.async_create_entry(title=selected_app_info.get("title"), data=selected_app_info)
+                return await self._async_create_app_entry(self.known_apps[user_input[CONF_NAME]])
             except Exception as ex:  # pylint: disable=broad-except
                 self.logger.error(ex)
                 errors["base"] = "unknown"
 
         # Get the list of known good things
         try:
-            self.known_apps = await self.identify_all()
-            app_choices = {app["app"]: app["title"] for app in self.known_apps}
+            self.known_apps = {app["app"]: app for app in await self.identify_all()}
+            app_choices = {name: app["title"] for name, app in self.known_apps.items()}
         except Exception:
             errors["base"] = "unknown"
             app_choices = {}
@@ -86,24 +96,32 @@ class SynapseConfigFlow(ConfigFlow, domain=DOMAIN):
     async def async_step_confirm(self, user_input=None):
         """Handle the confirmation step."""
         if user_input is not None:
-            return self.async_create_entry(title=self.application["title"], data=self.application)
+            return await self._async_create_app_entry(self.application)
 
         return self.async_show_form(
             step_id="confirm",
             description_placeholders={"name": self.application["title"]},
-            data_schema=vol.Schema({}),
+            data_schema=_EMPTY_SCHEMA,
         )
 
+    async def _async_create_app_entry(self, app: SynapseApplication):
+        """Create the entry for an app, unless it's already configured"""
+        await self.async_set_unique_id(app.get("unique_id"))
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=app.get("title"), data=app)
+
     async def identify_all(self):
         """
         Request all connected apps identify themselves
         Already registered apps will ignore the request
         """
         # set up listener
-        replies = []
-        def handle_event(event):
-            replies.append(event.data.get("compressed"))
-        remove = self.hass.bus.async_listen(f"{EVENT_NAMESPACE}/identify", handle_event)
+        replies: set[str] = set()
+        remove = self.hass.bus.async_listen(
+            f"{EVENT_NAMESPACE}/identify",
+            partial(_collect_identify, replies),
+            event_filter=_identify_filter,
+        )
 
         # emit reload request
         self.hass.bus.async_fire(f"{EVENT_NAMESPACE}/discovery")
@@ -114,5 +132,9 @@ class SynapseConfigFlow(ConfigFlow, domain=DOMAIN):
         # Stop listening
         remove()
 
-        # string[] -> dict[]
-        return [hex_to_object(hex_str) for hex_str in replies]
+        # string[] -> dict[], one entry per app
+        apps = {}
+        for hex_str in replies:
+            app = hex_to_object(hex_str)
+            apps[app.get("unique_id")] = app
+        return list(apps.values())
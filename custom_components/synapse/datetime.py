@@ -3,13 +3,15 @@ import logging
 from datetime import datetime
 from homeassistant.components.datetime import DateTimeEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .synapse.base_entity import SynapseBaseEntity
 from .synapse.bridge import SynapseBridge
 from .synapse.const import DOMAIN, SynapseDateTimeDefinition
 
+_LOGGER = logging.getLogger(__name__)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -17,11 +19,11 @@ async def async_setup_entry(
 ) -> None:
     """Setup the router platform."""
     bridge: SynapseBridge = hass.data[DOMAIN][config_entry.entry_id]
-    entities = bridge.app_data.get("datetime")
-    if entities is not None:
-      async_add_entities(SynapseDateTime(hass, bridge, entity) for entity in entities)
+    async_add_entities([SynapseDateTime(hass, bridge, entity) for entity in bridge.entities_for("datetime")])
 
 class SynapseDateTime(SynapseBaseEntity, DateTimeEntity):
+    logger = _LOGGER
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -29,16 +31,13 @@ class SynapseDateTime(SynapseBaseEntity, DateTimeEntity):
         entity: SynapseDateTimeDefinition,
     ):
         super().__init__(hass, bridge, entity)
-        self.logger = logging.getLogger(__name__)
 
-    @property
-    def native_value(self):
-        return datetime.fromisoformat(self.entity.get("native_value"))
+    def _apply_attributes(self) -> None:
+        super()._apply_attributes()
+        # parse once per update, not on every state read
+        native_value = self.entity.get("native_value")
+        self._attr_native_value = datetime.fromisoformat(native_value) if native_value else None
 
-    @callback
     async def async_set_value(self, value: datetime, **kwargs) -> None:
         """Proxy the request to set the value."""
-        self.hass.bus.async_fire(
-            self.bridge.event_name("set_value"),
-            {"unique_id": self.entity.get("unique_id"), "value": value.isoformat(), **kwargs},
-        )
+        self._fire("set_value", value=value.isoformat(), **kwargs)
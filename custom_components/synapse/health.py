@@ -7,21 +7,24 @@ from homeassistant.helpers.device_registry import DeviceInfo
 
 from .synapse.bridge import SynapseBridge
 
+_LOGGER = logging.getLogger(__name__)
+
 class SynapseHealthSensor(BinarySensorEntity):
+    logger = _LOGGER
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(
         self,
         bridge: SynapseBridge,
         hass: HomeAssistant
     ):
-        self.logger = logging.getLogger(__name__)
         self.hass = hass
         self.bridge = bridge
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                self.bridge.event_name("health"),
-                self._handle_availability_update,
-            )
-        )
+
+    async def async_added_to_hass(self) -> None:
+        """Receive availability changes from the bridge"""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.bridge.register_entity(self))
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -33,23 +36,19 @@ class SynapseHealthSensor(BinarySensorEntity):
             return "mdi:server"
         return "mdi:server-outline"
 
-    @property
-    def entity_category(self):
-        return EntityCategory.DIAGNOSTIC
-
     @property
     def name(self):
         return f"{self.bridge.app_data.get("title")} Online"
 
     @property
     def unique_id(self):
-        return f"{self.bridge.app_data.get("unique_id")}-online"
+        return f"{self.bridge.metadata_unique_id}-online"
 
     @property
     def is_on(self):
         return self.bridge.online
 
     @callback
-    async def _handle_availability_update(self, event):
+    def _handle_availability_update(self) -> None:
         """Handle health status update."""
-        self.async_schedule_update_ha_state(True)
+        self.async_write_ha_state()
@@ -2,13 +2,15 @@ import logging
 
 from homeassistant.components.lock import LockEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .synapse.base_entity import SynapseBaseEntity
 from .synapse.bridge import SynapseBridge
 from .synapse.const import DOMAIN, SynapseLockDefinition
 
+_LOGGER = logging.getLogger(__name__)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -16,11 +18,11 @@ async def async_setup_entry(
 ) -> None:
     """Setup the router platform."""
     bridge: SynapseBridge = hass.data[DOMAIN][config_entry.entry_id]
-    entities = bridge.app_data.get("lock")
-    if entities is not None:
-      async_add_entities(SynapseLock(hass, bridge, entity) for entity in entities)
+    async_add_entities([SynapseLock(hass, bridge, entity) for entity in bridge.entities_for("lock")])
 
 class SynapseLock(SynapseBaseEntity, LockEntity):
+    logger = _LOGGER
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -28,7 +30,6 @@ class SynapseLock(SynapseBaseEntity, LockEntity):
         entity: SynapseLockDefinition,
     ):
         super().__init__(hass, bridge, entity)
-        self.logger = logging.getLogger(__name__)
 
     @property
     def changed_by(self):
@@ -66,23 +67,14 @@ class SynapseLock(SynapseBaseEntity, LockEntity):
     def supported_features(self):
         return self.entity.get("supported_features")
 
-    @callback
     async def async_lock(self, **kwargs) -> None:
         """Proxy the request to lock."""
-        self.hass.bus.async_fire(
-            self.bridge.event_name("lock"), {"unique_id": self.entity.get("unique_id"), **kwargs}
-        )
+        self._fire("lock", **kwargs)
 
-    @callback
     async def async_unlock(self, **kwargs) -> None:
         """Proxy the request to unlock."""
-        self.hass.bus.async_fire(
-            self.bridge.event_name("unlock"), {"unique_id": self.entity.get("unique_id"), **kwargs}
-        )
+        self._fire("unlock", **kwargs)
 
-    @callback
     async def async_open(self, **kwargs) -> None:
         """Proxy the request to open."""
-        self.hass.bus.async_fire(
-            self.bridge.event_name("open"), {"unique_id": self.entity.get("unique_id"), **kwargs}
-        )
+        self._fire("open", **kwargs)
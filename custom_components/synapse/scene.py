@@ -2,13 +2,15 @@ import logging
 
 from homeassistant.components.scene import Scene as SceneEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .synapse.base_entity import SynapseBaseEntity
 from .synapse.bridge import SynapseBridge
 from .synapse.const import DOMAIN, SynapseSceneDefinition
 
+_LOGGER = logging.getLogger(__name__)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -16,11 +18,11 @@ async def async_setup_entry(
 ) -> None:
     """Setup the router platform."""
     bridge: SynapseBridge = hass.data[DOMAIN][config_entry.entry_id]
-    entities = bridge.app_data.get("scene")
-    if entities is not None:
-      async_add_entities(SynapseScene(hass, bridge, entity) for entity in entities)
+    async_add_entities([SynapseScene(hass, bridge, entity) for entity in bridge.entities_for("scene")])
 
 class SynapseScene(SynapseBaseEntity, SceneEntity):
+    logger = _LOGGER
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -28,11 +30,7 @@ class SynapseScene(SynapseBaseEntity, SceneEntity):
         entity: SynapseSceneDefinition,
     ):
         super().__init__(hass, bridge, entity)
-        self.logger = logging.getLogger(__name__)
 
-    @callback
     async def async_activate(self) -> None:
         """Handle the scene press."""
-        self.hass.bus.async_fire(
-            self.bridge.event_name("activate"), {"unique_id": self.entity.get("unique_id")}
-        )
+        self._fire("activate")
@@ -2,13 +2,15 @@ import logging
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .synapse.base_entity import SynapseBaseEntity
 from .synapse.bridge import SynapseBridge
 from .synapse.const import DOMAIN, SynapseSelectDefinition
 
+_LOGGER = logging.getLogger(__name__)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -16,11 +18,11 @@ async def async_setup_entry(
 ) -> None:
     """Setup the router platform."""
     bridge: SynapseBridge = hass.data[DOMAIN][config_entry.entry_id]
-    entities = bridge.app_data.get("select")
-    if entities is not None:
-      async_add_entities(SynapseSelect(hass, bridge, entity) for entity in entities)
+    async_add_entities([SynapseSelect(hass, bridge, entity) for entity in bridge.entities_for("select")])
 
 class SynapseSelect(SynapseBaseEntity, SelectEntity):
+    logger = _LOGGER
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -28,7 +30,6 @@ class SynapseSelect(SynapseBaseEntity, SelectEntity):
         entity: SynapseSelectDefinition,
     ):
         super().__init__(hass, bridge, entity)
-        self.logger = logging.getLogger(__name__)
 
     @property
     def current_option(self):
@@ -38,10 +39,6 @@ class SynapseSelect(SynapseBaseEntity, SelectEntity):
     def options(self):
         return self.entity.get("options")
 
-    @callback
     async def async_select_option(self, option: str, **kwargs) -> None:
         """Proxy the request to select an option."""
-        self.hass.bus.async_fire(
-            self.bridge.event_name("select_option"),
-            {"unique_id": self.entity.get("unique_id"), "option": option, **kwargs},
-        )
+        self._fire("select_option", option=option, **kwargs)
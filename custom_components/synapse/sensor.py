@@ -9,6 +9,8 @@ from .synapse.base_entity import SynapseBaseEntity
 from .synapse.bridge import SynapseBridge
 from .synapse.const import DOMAIN, SynapseSensorDefinition
 
+_LOGGER = logging.getLogger(__name__)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -16,16 +18,19 @@ async def async_setup_entry(
 ) -> None:
     """Setup the router platform."""
     bridge: SynapseBridge = hass.data[DOMAIN][config_entry.entry_id]
-    entities = bridge.app_data.get("sensor")
-    if entities is not None:
-      async_add_entities(SynapseSensor(hass, bridge, entity) for entity in entities)
+    async_add_entities([SynapseSensor(hass, bridge, entity) for entity in bridge.entities_for("sensor")])
 
 class SynapseSensor(SynapseBaseEntity, SensorEntity):
+    logger = _LOGGER
+
     def __init__(
         self, hass: HomeAssistant, bridge: SynapseBridge, entity: SynapseSensorDefinition
     ):
         super().__init__(hass, bridge, entity)
-        self.logger = logging.getLogger(__name__)
+
+    def _apply_attributes(self) -> None:
+        super()._apply_attributes()
+        self._attr_device_class = self.entity.get("device_class")
 
     @property
     def state(self):
@@ -51,10 +56,6 @@ class SynapseSensor(SynapseBaseEntity, SensorEntity):
     def supported_features(self):
         return self.entity.get("supported_features")
 
-    @property
-    def device_class(self):
-        return self.entity.get("device_class")
-
     @property
     def unit_of_measurement(self):
         return self.entity.get("unit_of_measurement")
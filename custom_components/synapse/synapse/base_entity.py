@@ -13,6 +13,7 @@ It is up to the helper domains to:
 - implement domain specific properties & event callbacks
 """
 import logging
+from types import MappingProxyType
 
 from homeassistant.const import EntityCategory
 from homeassistant.core import callback, HomeAssistant
@@ -22,7 +23,21 @@ from homeassistant.helpers.entity import Entity
 from .bridge import SynapseBridge
 from .const import SynapseBaseEntity
 
+_LOGGER = logging.getLogger(__name__)
+
+# synapse entity_category strings -> HA enum
+_ENTITY_CATEGORY = {
+    "config": EntityCategory.CONFIG,
+    "diagnostic": EntityCategory.DIAGNOSTIC,
+}
+
+# shared by every entity that declares no attributes
+_EMPTY_ATTRIBUTES = MappingProxyType({})
+
 class SynapseBaseEntity(Entity):
+    # shared across instances, domains swap in their own module logger
+    logger = _LOGGER
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -30,23 +45,23 @@ class SynapseBaseEntity(Entity):
         entity: SynapseBaseEntity
     ) -> None:
         """Init"""
-        self.logger = logging.getLogger(__name__)
         self.hass = hass
         self.bridge = bridge
         self.entity = entity
-        self.logger.debug(f"{self.bridge.app_name} init entity: {self.entity.get("name")}")
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                self.bridge.event_name("update"),
-                self._handle_entity_update,
-            )
-        )
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                self.bridge.event_name("health"),
-                self._handle_availability_update,
-            )
-        )
+        self._attr_unique_id = entity.get("unique_id")
+        self._attr_translation_key = entity.get("translation_key")
+        self._attr_entity_category = _ENTITY_CATEGORY.get(entity.get("entity_category"))
+        self._apply_attributes()
+        # shared by argument-less service calls, listeners treat event data as read only
+        self._base_payload = {"unique_id": self._attr_unique_id}
+        self.logger.debug("%s init entity: %s", self.bridge.app_name, self._attr_name)
+
+    async def async_added_to_hass(self) -> None:
+        """Ask the bridge to route update & health events for this entity"""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.bridge.register_entity(self))
+        # the bridge may have changed state between construction and registration
+        self._update_available()
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -56,42 +71,41 @@ class SynapseBaseEntity(Entity):
             device = self.bridge.via_primary_device[declared_device] or None
             if device is not None:
                 return device
-            self.logger.error(f"{self.bridge.app_name}:{self.entity.get("name")} cannot find device info for {declared_device}")
+            self.logger.error("%s:%s cannot find device info for %s", self.bridge.app_name, self._attr_name, declared_device)
 
         # everything is associated with the app device if all else fails
         return self.bridge.primary_device
 
-    @property
-    def unique_id(self):
-        return self.entity.get("unique_id")
-
-    @property
-    def suggested_object_id(self):
-        return self.entity.get("suggested_object_id")
-
-    @property
-    def translation_key(self):
-        return self.entity.get("translation_key")
-
-    @property
-    def icon(self):
-        return self.entity.get("icon")
+    def _apply_attributes(self) -> None:
+        """
+        Snapshot the mutable parts of the entity definition into `_attr_*` fields.
+        HA reads these directly on every state write, domains extend this with their own fields.
+        """
+        get = self.entity.get
+        self._attr_name = get("name")
+        self._attr_icon = get("icon")
+        self._attr_extra_state_attributes = get("attributes") or _EMPTY_ATTRIBUTES
+        self._update_available()
 
-    @property
-    def extra_state_attributes(self):
-        return self.entity.get("attributes") or {}
+    def _update_available(self) -> None:
+        """
+        Unavailable:
+        - if the bridge is offline
+        - if the entity opts into being unavail but still declared (ts side)
+        """
+        self._attr_available = self.bridge.online and self.entity.get("disabled") is not True
 
-    @property
-    def entity_category(self):
-        if self.entity.get("entity_category") == "config":
-            return EntityCategory.CONFIG
-        if self.entity.get("entity_category") == "diagnostic":
-            return EntityCategory.DIAGNOSTIC
-        return None
+    @callback
+    def _fire(self, action: str, **data) -> None:
+        """Proxy a service call to the app"""
+        self.hass.bus.async_fire(
+            self.bridge.event_name(action),
+            {**self._base_payload, **data} if data else self._base_payload,
+        )
 
     @property
-    def name(self):
-        return self.entity.get("name")
+    def suggested_object_id(self):
+        return self.entity.get("suggested_object_id")
 
     @property
     def suggested_area_id(self):
@@ -101,29 +115,21 @@ class SynapseBaseEntity(Entity):
     def labels(self):
         return self.entity.get("labels")
 
-    @property
-    def available(self):
-        """
-        - if the bridge is offline
-        - if the entity opts into being unavail but still declared (ts side)
-        """
-        if self.entity.get("disabled") == True:
-            return False
-        return self.bridge.online
-
     @callback
-    def _handle_entity_update(self, event):
-        # events target bridge, up to entities to filter for responses that apply to them
-        #
-        # mental note: this was done to reduce quantity of unique events flying around
-        # this is probably worth changing to namespace/{unique_id}/update or something
-        # easier to debug + less useless event handle executions
-        if event.data.get("unique_id") == self.entity.get("unique_id"):
-            self.logger.debug(f"{self.bridge.app_name}:{self.entity.get("name")} receive update")
-            self.entity = event.data.get("data")
-            self.async_write_ha_state()
+    def _handle_entity_update(self, data) -> None:
+        """Receive a new definition, the bridge has already matched it to this entity by unique_id"""
+        # apps re-send full definitions, identical ones would only produce a no-op state write
+        if data == self.entity:
+            return
+        self.logger.debug("%s:%s receive update", self.bridge.app_name, self._attr_name)
+        self.entity = data
+        self._apply_attributes()
+        self.async_write_ha_state()
 
     @callback
-    async def _handle_availability_update(self, event):
-        """Handle health status update."""
-        self.async_schedule_update_ha_state(True)
+    def _handle_availability_update(self) -> None:
+        """Handle health status update, only write state if availability actually flipped"""
+        available = self._attr_available
+        self._update_available()
+        if self._attr_available != available:
+            self.async_write_ha_state()
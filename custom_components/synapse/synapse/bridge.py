@@ -50,6 +50,10 @@ If the list of entities changes at runtime, the hash will change and the integra
 """
 import asyncio
 import logging
+import random
+import sys
+from collections.abc import Callable
+from weakref import WeakValueDictionary
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -67,8 +71,10 @@ from homeassistant.const import (
 from homeassistant.core import callback, HomeAssistant
 from homeassistant.helpers import entity_registry as er, device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
 
 from .const import (
+    APP_OFFLINE_DELAY,
     DOMAIN,
     PLATFORMS,
     EVENT_NAMESPACE,
@@ -77,17 +83,43 @@ from .const import (
     QUERY_TIMEOUT,
     RETRIES,
     RETRY_DELAY,
+    RETRY_MAX_DELAY,
 )
 from .helpers import hex_to_object
-import logging
-
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback, HomeAssistant
-
-from .const import DOMAIN, EVENT_NAMESPACE, APP_OFFLINE_DELAY
 
 hashDict = {}
 
+# service call events entities send back to the app
+_ACTIONS = (
+    "activate",
+    "lock",
+    "open",
+    "press",
+    "select_option",
+    "set_fan_mode",
+    "set_humidity",
+    "set_hvac_mode",
+    "set_preset_mode",
+    "set_swing_mode",
+    "set_temperature",
+    "set_value",
+    "toggle",
+    "turn_off",
+    "turn_on",
+    "unlock",
+)
+
+# device info keys, copied as is from synapse metadata
+_DEVICE_INFO_FIELDS = (
+    (ATTR_CONFIGURATION_URL, "configuration_url"),
+    (ATTR_HW_VERSION, "hw_version"),
+    (ATTR_MANUFACTURER, "manufacturer"),
+    (ATTR_MODEL, "model"),
+    (ATTR_NAME, "name"),
+    (ATTR_SERIAL_NUMBER, "serial_number"),
+    (ATTR_SUGGESTED_AREA, "suggested_area"),
+    (ATTR_SW_VERSION, "sw_version"),
+)
 
 class SynapseBridge:
     """
@@ -107,27 +139,75 @@ class SynapseBridge:
         self.app_data: SynapseApplication = config_entry.data
         self.app_name = self.app_data.get("app")
         self.metadata_unique_id = self.app_data.get("unique_id")
-        hass.data.setdefault(DOMAIN, {})[self.metadata_unique_id] = self
 
-        self.logger.debug(f"{self.app_name} init bridge")
+        self.logger.debug("%s init bridge", self.app_name)
 
         self.namespace = EVENT_NAMESPACE
+        self._build_event_names()
         self.online = False
         self._heartbeat_timer = None
+        self._last_heartbeat = 0.0
         self._removals = []
+        # weak, an entity that never gets to unregister (failed add) shouldn't be kept alive by the bridge
+        self._entities: WeakValueDictionary[str, Entity] = WeakValueDictionary()
+        self._pending_updates: dict[str, dict] = {}
+        self._flush_handle = None
+        self._platform_cache: dict[str, list] = {}
+        self.platforms = self._active_platforms()
 
         self._listen()
 
     async def async_cleanup(self) -> None:
         """Called when tearing down the bridge, clean up resources and prepare to go away"""
-        self.logger.info(f"{self.app_name} cleanup bridge")
-        self._heartbeat_timer.cancel()
+        self.logger.info("%s cleanup bridge", self.app_name)
+        self._cancel_heartbeat_timer()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_updates.clear()
         for remove in self._removals:
             remove()
 
     def event_name(self, event: str) -> str:
         """Standard format for event bus names to keep apps separate"""
-        return f"{self.namespace}/{event}/{self.app_name}"
+        name = self._event_names.get(event)
+        if name is None:
+            name = self._event_names[event] = sys.intern(f"{self.namespace}/{event}/{self.app_name}")
+        return name
+
+    def _build_event_names(self) -> None:
+        """
+        Reset the event name cache, pre-building the action names used by service calls.
+        Anything else is added the first time it's requested.
+        """
+        self._event_names = {
+            action: sys.intern(f"{self.namespace}/{action}/{self.app_name}")
+            for action in _ACTIONS
+        }
+
+    def _active_platforms(self) -> list[str]:
+        """Platforms the app declared entities for, binary_sensor always hosts the health sensor"""
+        return [domain for domain in PLATFORMS if domain == "binary_sensor" or self.app_data.get(domain)]
+
+    def entities_for(self, platform: str) -> list:
+        """Entity definitions the app declared for a platform, empty if none"""
+        entities = self._platform_cache.get(platform)
+        if entities is None:
+            entities = self._platform_cache[platform] = self.app_data.get(platform) or []
+        return entities
+
+    def register_entity(self, entity: Entity) -> Callable[[], None]:
+        """Route update & health events for an entity, returns the unregister callback"""
+        unique_id = entity.unique_id
+        self._entities[unique_id] = entity
+
+        @callback
+        def remove() -> None:
+            # a replacement entity may have claimed the unique_id in the meantime
+            if self._entities.get(unique_id) is entity:
+                del self._entities[unique_id]
+
+        return remove
 
     def _listen(self) -> None:
         """Set up listeners for app level communications. Entity updates use different channels"""
@@ -146,19 +226,61 @@ class SynapseBridge:
               self._handle_explicit_shutdown
           )
         )
+
+        # Entity updates are sent to the bridge, look up the target instead of every entity filtering every update
+        self._removals.append(
+          self.hass.bus.async_listen(
+              self.event_name("update"),
+              self._handle_entity_update
+          )
+        )
         self._reset_heartbeat_timer()
 
+    @callback
+    def _handle_entity_update(self, event) -> None:
+        """
+        Queue an entity update for the entity it targets.
+        Apps tend to send updates in bursts, only the latest one per entity in a loop iteration gets applied.
+        """
+        unique_id = event.data.get("unique_id")
+        if unique_id not in self._entities:
+            return
+        self._pending_updates[unique_id] = event.data.get("data")
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._flush_updates)
+
+    @callback
+    def _flush_updates(self) -> None:
+        """Hand queued updates off to their entities"""
+        self._flush_handle = None
+        pending = self._pending_updates
+        self._pending_updates = {}
+        for unique_id, data in pending.items():
+            # entity may have been removed while the update was queued
+            entity = self._entities.get(unique_id)
+            if entity is not None:
+                entity._handle_entity_update(data)
+
+    @callback
+    def _notify_health(self) -> None:
+        """
+        Push availability changes straight to registered entities.
+        The bus event is still emitted for anything else watching the app.
+        """
+        for entity in list(self._entities.values()):
+            entity._handle_availability_update()
+        self.hass.bus.async_fire(self.event_name("health"))
+
     @callback
     def _handle_explicit_shutdown(self, event) -> None:
         """Explicit shutdown events emitted by app"""
-        self.logger.info(f"{self.app_name} offline notification")
+        self.logger.info("%s offline notification", self.app_name)
         # Update entity availability
         self.online = False
-        self.hass.bus.async_fire(self.event_name("health"))
+        self._notify_health()
 
         # Heartbeat no longer matters
-        if self._heartbeat_timer:
-            self._heartbeat_timer.cancel()
+        self._cancel_heartbeat_timer()
 
     @callback
     def _mark_as_dead(self, event=None) -> None:
@@ -166,15 +288,34 @@ class SynapseBridge:
         if self.online == False:
             return
         # RIP
-        self.logger.warning(f"{self.app_name} lost heartbeat")
+        self.logger.warning("%s lost heartbeat", self.app_name)
         self.online = False
-        self.hass.bus.async_fire(self.event_name("health"))
+        self._notify_health()
 
     def _reset_heartbeat_timer(self) -> None:
-        """Detected a heartbeat, wait for next"""
+        """
+        Detected a heartbeat, push the deadline back.
+        A single timer stays armed & re-checks the deadline when it fires, rather than being replaced every heartbeat.
+        """
+        self._last_heartbeat = self.hass.loop.time()
+        if self._heartbeat_timer is None:
+            self._heartbeat_timer = self.hass.loop.call_later(APP_OFFLINE_DELAY, self._check_heartbeat)
+
+    @callback
+    def _check_heartbeat(self) -> None:
+        """Timer fired, only dead if no heartbeat arrived in the meantime"""
+        remaining = self._last_heartbeat + APP_OFFLINE_DELAY - self.hass.loop.time()
+        if remaining > 0:
+            self._heartbeat_timer = self.hass.loop.call_later(remaining, self._check_heartbeat)
+            return
+        self._heartbeat_timer = None
+        self._mark_as_dead()
+
+    def _cancel_heartbeat_timer(self) -> None:
+        """Stop waiting on heartbeats"""
         if self._heartbeat_timer:
             self._heartbeat_timer.cancel()
-        self._heartbeat_timer = self.hass.loop.call_later(APP_OFFLINE_DELAY, self._mark_as_dead)
+            self._heartbeat_timer = None
 
     @callback
     def handle_heartbeat(self, event) -> None:
@@ -186,7 +327,7 @@ class SynapseBridge:
             return
 
         # if going from offline -> online
-        self.logger.info(f"{self.app_name} restored contact")
+        self.logger.info("%s restored contact", self.app_name)
 
         if event is not None and self.app_data is not None:
             if self.metadata_unique_id in hashDict:
@@ -194,47 +335,41 @@ class SynapseBridge:
 
                 incoming_hash = event.data.get("hash")
                 if incoming_hash != hashDict[self.metadata_unique_id]:
-                    self.logger.error(f"async_reload {incoming_hash} != {hashDict[self.metadata_unique_id]}")
+                    self.logger.error("async_reload %s != %s", incoming_hash, hashDict[self.metadata_unique_id])
                     self.hass.async_create_task(
                         self.hass.config_entries.async_reload(entry_id)
                     )
                     self.logger.error("/async_reload")
 
         self.online = True
-        self.hass.bus.async_fire(self.event_name("health"))
+        self._notify_health()
 
 
     def format_device_info(self, device = None):
         """Translate between synapse data objects and hass device info"""
         device = device or self.app_data.get("device")
-        return {
-            ATTR_CONFIGURATION_URL: device.get("configuration_url"),
-            ATTR_HW_VERSION: device.get("hw_version"),
-            ATTR_IDENTIFIERS: {
-                (DOMAIN, device.get("unique_id") or self.metadata_unique_id),
-            },
-            ATTR_MANUFACTURER: device.get("manufacturer"),
-            ATTR_MODEL: device.get("model"),
-            ATTR_NAME: device.get("name"),
-            ATTR_SERIAL_NUMBER: device.get("serial_number"),
-            ATTR_SUGGESTED_AREA: device.get("suggested_area"),
-            ATTR_SW_VERSION: device.get("sw_version"),
-        }
+        get = device.get
+        params = {attr: get(key) for attr, key in _DEVICE_INFO_FIELDS}
+        params[ATTR_IDENTIFIERS] = {(DOMAIN, get("unique_id") or self.metadata_unique_id)}
+        return params
 
     async def async_reload(self) -> None:
         """Attach reload call to gather new metadata & update local info"""
-        self.logger.debug(f"{self.app_name} request reload")
+        self.logger.debug("%s request reload", self.app_name)
 
         # retry a few times - apps attempt reconnect on an interval
         # recent boots will have a short delay before the app can successfully reconnect
-        data = await self._async_fetch_state(self.app_name)
+        data = await self._async_fetch_state()
         for x in range(0, RETRIES):
             if data is not None:
-                self.logger.info(f"{self.app_name} reload success")
+                self.logger.info("%s reload success", self.app_name)
                 break
-            self.logger.warning(f"({x}/{RETRIES}) {self.app_name} reload wait {RETRY_DELAY}s & retry")
-            await asyncio.sleep(RETRY_DELAY)
-            data = await self._async_fetch_state(self.app_name)
+            # exponential backoff, half of each wait is jittered so bridges booting together spread out
+            delay = min(RETRY_MAX_DELAY, RETRY_DELAY * 2 ** x)
+            delay = delay / 2 + random.uniform(0, delay / 2)
+            self.logger.warning("(%d/%d) %s reload wait %.1fs & retry", x, RETRIES, self.app_name, delay)
+            await asyncio.sleep(delay)
+            data = await self._async_fetch_state()
 
         if data is None:
             self.logger.warning("no response, is app connected?")
@@ -242,8 +377,12 @@ class SynapseBridge:
 
         # Handle incoming data
         self.app_data = data
+        self._platform_cache = {}
+        self.platforms = self._active_platforms()
         hashDict[self.metadata_unique_id] = data.get("hash")
-        self.app_name = self.app_data.get("app")
+        if self.app_data.get("app") != self.app_name:
+            self.app_name = self.app_data.get("app")
+            self._build_event_names()
         self._refresh_devices()
         self._refresh_entities()
 
@@ -253,7 +392,7 @@ class SynapseBridge:
     def _refresh_devices(self) -> None:
         """Parse through the incoming payload, and set up devices to match"""
         self.via_primary_device = {}
-        expected_device_ids = []
+        expected_device_ids = set()
         device_registry = dr.async_get(self.hass)
 
         # create / update base device
@@ -263,7 +402,7 @@ class SynapseBridge:
             config_entry_id=self.config_entry.entry_id,
             **params
         )
-        expected_device_ids.append(device.id)
+        expected_device_ids.add(device.id)
 
         # if the app declares secondary devices, register them also
         # use via_device to create an association with the base
@@ -271,7 +410,7 @@ class SynapseBridge:
 
 
         for device in secondary_devices:
-            self.logger.debug(f"{self.app_name} secondary device: {device.get("name")}")
+            self.logger.debug("%s secondary device: %s", self.app_name, device.get("name"))
 
             # create params
             params = self.format_device_info(device)
@@ -282,16 +421,17 @@ class SynapseBridge:
             device = device_registry.async_get_or_create(config_entry_id=self.config_entry.entry_id,**params)
 
             # track as valid id
-            expected_device_ids.append(device.id)
+            expected_device_ids.add(device.id)
 
+        # only this entry's devices can be stale, the registry indexes those for us
         unexpected_devices = []
-        for _, device in device_registry.devices.items():
+        for device in dr.async_entries_for_config_entry(device_registry, self.config_entry.entry_id):
             if device.primary_config_entry == self.config_entry.entry_id:
                 if device.id not in expected_device_ids:
                     unexpected_devices.append(device.id)
 
         for device_id in unexpected_devices:
-            self.logger.warning(f"remove {device_id}")
+            self.logger.warning("remove %s", device_id)
             device_registry.async_remove_device(device_id)
 
     def _refresh_entities(self) -> None:
@@ -300,52 +440,57 @@ class SynapseBridge:
         Any unique id that currently exists that shouldn't gets a remove
         """
         entity_registry = er.async_get(self.hass)
-        # repeat logic for all domains
-        for domain in PLATFORMS:
-            incoming_list = self.app_data.get(domain)
-            if incoming_list is None:
-                continue
-
-            found = []
-            for entity in incoming_list:
-                found.append(entity.get("unique_id"))
-
-            # removing from inside the loop blows things up
-            # create list to run as follow up
-            remove = []
-            for entity_id, entry in entity_registry.entities.items():
-                if entry.platform == "synapse" and entry.config_entry_id == self.config_entry.entry_id:
-                    # match based on unique_id, rm by entity_id
-                    if entry.unique_id not in found:
-                        remove.append(entry.entity_id)
-
-            for entity_id in remove:
-                entity_registry.async_remove(entity_id)
-
-    async def _async_fetch_state(self, app: str) -> SynapseApplication:
+        # one set across all declared domains, a per-domain diff would flag every other domain as stale
+        found = {
+            entity.get("unique_id")
+            for domain in self.platforms
+            for entity in self.entities_for(domain)
+        }
+        # health check sensor isn't part of the payload
+        found.add(f"{self.metadata_unique_id}-online")
+
+        # removing from inside the loop blows things up
+        # create list to run as follow up
+        # the registry indexes entries by config entry, no need to walk every entity in HA
+        remove = []
+        for entry in er.async_entries_for_config_entry(entity_registry, self.config_entry.entry_id):
+            if entry.platform == "synapse":
+                # match based on unique_id, rm by entity_id
+                if entry.unique_id not in found:
+                    remove.append(entry.entity_id)
+
+        for entity_id in remove:
+            entity_registry.async_remove(entity_id)
+
+    async def _async_fetch_state(self) -> SynapseApplication:
         """Attach reload call to gather new metadata & update local info"""
-        self.hass.bus.async_fire(f"{EVENT_NAMESPACE}/discovery/{app}")
-        hex_str = await self._wait_for_reload_reply(f"{EVENT_NAMESPACE}/identify/{app}")
+        hex_str = await self._wait_for_reload_reply(
+            self.event_name("identify"),
+            self.event_name("discovery"),
+        )
         if hex_str is None:
             return None
         return hex_to_object(hex_str)
 
-    async def _wait_for_reload_reply(self, event_name) -> str:
+    async def _wait_for_reload_reply(self, event_name, request_event) -> str:
         """
-        Wait for the app to reply, then return.
+        Fire request_event, wait for the app to reply, then return.
         Contains short timeout to race reply and return None
         """
-        future = asyncio.Future()
+        future = self.hass.loop.create_future()
         @callback
         def handle_event(event):
             if not future.done():
                 future.set_result(event.data["compressed"]) # <<< success value
-        self.hass.loop.call_soon_threadsafe(
-            self.hass.bus.async_listen_once,
-            event_name,
-            handle_event
-        )
-        try:
-            return await asyncio.wait_for(future, timeout=QUERY_TIMEOUT)
-        except asyncio.TimeoutError:
+        # already running in the loop, no need for a threadsafe hop to attach
+        remove = self.hass.bus.async_listen_once(event_name, handle_event)
+        # listener is in place before the request goes out, a fast reply can't be missed
+        self.hass.bus.async_fire(request_event)
+        # a miss is the normal outcome for apps that aren't connected, wait() reports it without raising
+        done, _ = await asyncio.wait((future,), timeout=QUERY_TIMEOUT)
+        if not done:
+            # listen_once only removes itself after firing
+            remove()
+            future.cancel()
             return None # <<< error value
+        return future.result()
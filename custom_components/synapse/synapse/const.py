@@ -2,8 +2,9 @@ APP_OFFLINE_DELAY=30
 DOMAIN = "synapse"
 EVENT_NAMESPACE = "digital_alchemy"
 QUERY_TIMEOUT=0.1
-RETRIES=3
-RETRY_DELAY=5
+RETRIES=5
+RETRY_DELAY=0.5
+RETRY_MAX_DELAY=8
 
 class SynapseMetadata:
     """Entity device information for device registry."""
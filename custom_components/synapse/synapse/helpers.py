@@ -1,16 +1,31 @@
-import binascii
-import gzip
-import io
-import json
+import struct
+import zlib
+
+from homeassistant.util.json import json_loads
 
 from .const import SynapseApplication
 
+# parsed payloads, keyed by gzip trailer (crc32, isize)
+# callers treat the returned objects as read only, so they can be shared
+_PAYLOAD_CACHE: dict[tuple[int, int], SynapseApplication] = {}
+_PAYLOAD_CACHE_SIZE = 8
+
 def hex_to_object(hex_str: str) -> SynapseApplication:
     """
     Consume a gzipped json string, return an object.
     Can be any object but will only be used for this single return type
     """
-    compressed_data = binascii.unhexlify(hex_str)
-    with gzip.GzipFile(fileobj=io.BytesIO(compressed_data)) as f:
-        json_str = f.read().decode('utf-8')
-    return json.loads(json_str)
+    raw = bytes.fromhex(hex_str)
+    # the last 8 bytes of a gzip member are the crc32 + size of the uncompressed data
+    key = struct.unpack("<II", raw[-8:])
+    data = _PAYLOAD_CACHE.get(key)
+    if data is not None:
+        return data
+
+    # one-shot decompress, header + trailer are handled in C by zlib (wbits 16+ = gzip wrapper)
+    # HA's (orjson backed) loader takes the utf-8 bytes as is
+    data = json_loads(zlib.decompress(raw, 16 + zlib.MAX_WBITS))
+    if len(_PAYLOAD_CACHE) >= _PAYLOAD_CACHE_SIZE:
+        del _PAYLOAD_CACHE[next(iter(_PAYLOAD_CACHE))]
+    _PAYLOAD_CACHE[key] = data
+    return data
@@ -2,13 +2,15 @@ import logging
 
 from homeassistant.components.text import TextEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .synapse.base_entity import SynapseBaseEntity
 from .synapse.bridge import SynapseBridge
 from .synapse.const import DOMAIN, SynapseTextDefinition
 
+_LOGGER = logging.getLogger(__name__)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -16,11 +18,11 @@ async def async_setup_entry(
 ) -> None:
     """Setup the router platform."""
     bridge: SynapseBridge = hass.data[DOMAIN][config_entry.entry_id]
-    entities = bridge.app_data.get("text")
-    if entities is not None:
-      async_add_entities(SynapseText(hass, bridge, entity) for entity in entities)
+    async_add_entities([SynapseText(hass, bridge, entity) for entity in bridge.entities_for("text")])
 
 class SynapseText(SynapseBaseEntity, TextEntity):
+    logger = _LOGGER
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -28,16 +30,11 @@ class SynapseText(SynapseBaseEntity, TextEntity):
         entity: SynapseTextDefinition,
     ):
         super().__init__(hass, bridge, entity)
-        self.logger = logging.getLogger(__name__)
 
     @property
     def native_value(self):
         return self.entity.get("native_value")
 
-    @callback
     async def async_set_value(self, value: str, **kwargs) -> None:
         """Proxy the request to set the value."""
-        self.hass.bus.async_fire(
-            self.bridge.event_name("set_value"),
-            {"unique_id": self.entity.get("unique_id"), "value": value, **kwargs},
-        )
+        self._fire("set_value", value=value, **kwargs)
@@ -3,13 +3,15 @@ import logging
 from datetime import time
 from homeassistant.components.time import TimeEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .synapse.base_entity import SynapseBaseEntity
 from .synapse.bridge import SynapseBridge
 from .synapse.const import DOMAIN, SynapseTimeDefinition
 
+_LOGGER = logging.getLogger(__name__)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -17,11 +19,11 @@ async def async_setup_entry(
 ) -> None:
     """Setup the router platform."""
     bridge: SynapseBridge = hass.data[DOMAIN][config_entry.entry_id]
-    entities = bridge.app_data.get("time")
-    if entities is not None:
-      async_add_entities(SynapseTime(hass, bridge, entity) for entity in entities)
+    async_add_entities([SynapseTime(hass, bridge, entity) for entity in bridge.entities_for("time")])
 
 class SynapseTime(SynapseBaseEntity, TimeEntity):
+    logger = _LOGGER
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -29,16 +31,13 @@ class SynapseTime(SynapseBaseEntity, TimeEntity):
         entity: SynapseTimeDefinition,
     ):
         super().__init__(hass, bridge, entity)
-        self.logger = logging.getLogger(__name__)
 
-    @property
-    def native_value(self):
-        return time.fromisoformat(self.entity.get("native_value"))
+    def _apply_attributes(self) -> None:
+        super()._apply_attributes()
+        # parse once per update, not on every state read
+        native_value = self.entity.get("native_value")
+        self._attr_native_value = time.fromisoformat(native_value) if native_value else None
 
-    @callback
     async def async_set_value(self, value: time, **kwargs) -> None:
         """Proxy the request to set the value."""
-        self.hass.bus.async_fire(
-            self.bridge.event_name("set_value"),
-            {"unique_id": self.entity.get("unique_id"), "value": value, **kwargs},
-        )
+        self._fire("set_value", value=value, **kwargs)